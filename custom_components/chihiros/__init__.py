@@ -3,24 +3,30 @@
 from __future__ import annotations
 
 import logging
+import sys
+from typing import TYPE_CHECKING
 
-try:
-    from homeassistant.components import bluetooth
+from .const import DOMAIN
+
+if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
-    from homeassistant.const import Platform
     from homeassistant.core import HomeAssistant
+
+# The chihirosctl CLI lives inside this package, so importing it runs this module.
+# Only load Home Assistant and the device stack when Home Assistant is the one
+# importing the integration, which it does in an executor thread.
+if TYPE_CHECKING or "homeassistant" in sys.modules:
+    from homeassistant.components import bluetooth
+    from homeassistant.const import Platform
     from homeassistant.exceptions import ConfigEntryNotReady
 
+    from .chihiros_led_control.device import BaseDevice, get_model_class_from_name
+    from .coordinator import ChihirosDataUpdateCoordinator
+    from .models import ChihirosData
+
     # TODO List the platforms that you want to support.
     # For your initial PR, limit it to 1 platform.
     PLATFORMS: list[Platform] = [Platform.LIGHT]
-except ModuleNotFoundError:
-    pass
-
-from .chihiros_led_control.device import BaseDevice, get_model_class_from_name
-from .const import DOMAIN
-from .coordinator import ChihirosDataUpdateCoordinator
-from .models import ChihirosData
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -62,6 +68,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        chihiros_data: ChihirosData = hass.data[DOMAIN].pop(entry.entry_id)
+        await chihiros_data.device.disconnect()
 
     return unload_ok
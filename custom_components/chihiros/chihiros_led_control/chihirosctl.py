@@ -1,37 +1,142 @@
 """Chihiros led control CLI entrypoint."""
 
 import asyncio
-import inspect
+import json
+import os
+import tempfile
 from datetime import datetime
-from typing import Any
+from typing import Any, Optional
 
 import typer
-from bleak import BleakScanner
 from rich import print
-from rich.table import Table
 from typing_extensions import Annotated
 
-from . import commands
-from .device import get_device_from_address, get_model_class_from_name
 from .weekday_encoding import WeekdaySelect
 
+try:
+    from uvloop import run as _run  # type: ignore
+except ImportError:
+    _run = asyncio.run
+
 app = typer.Typer()
 
-msg_id = commands.next_message_id()
+DEFAULT_DAEMON_SOCKET = os.path.join(tempfile.gettempdir(), "chihirosctl.sock")
+# command arguments that are sent to the daemon as ISO formatted strings
+_DATETIME_ARGS = ("sunrise", "sunset")
+
+# socket of a running daemon the commands are forwarded to
+_daemon_socket: str | None = None
 
 
-def _run_device_func(device_address: str, **kwargs: Any) -> None:
-    command_name = inspect.stack()[1][3]
+@app.callback()
+def main(
+    via: Annotated[
+        Optional[str],
+        typer.Option(
+            envvar="CHIHIROSCTL_SOCKET",
+            help="Send the command to a daemon listening on this socket.",
+        ),
+    ] = None,
+) -> None:
+    """Control Chihiros LEDs via bluetooth."""
+    global _daemon_socket
+    _daemon_socket = via
+
+
+def _run_device_func(command_name: str, device_address: str, **kwargs: Any) -> None:
+    if _daemon_socket is not None:
+        _run(
+            _send_to_daemon(_daemon_socket, command_name, device_address, kwargs)
+        )
+        return
 
     async def _async_func() -> None:
+        from .device import get_device_from_address
+
         dev = await get_device_from_address(device_address)
-        if hasattr(dev, command_name):
-            await getattr(dev, command_name)(**kwargs)
-        else:
+        if not hasattr(dev, command_name):
             print(f"{dev.__class__.__name__} doesn't support {command_name}")
             raise typer.Abort()
+        async with dev:
+            await getattr(dev, command_name)(**kwargs)
+
+    _run(_async_func())
+
+
+async def _send_to_daemon(
+    socket_path: str, command_name: str, device_address: str, kwargs: dict[str, Any]
+) -> None:
+    """Send a command to a running daemon and wait for its result."""
+    try:
+        reader, writer = await asyncio.open_unix_connection(socket_path)
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f"No daemon is listening on {socket_path}")
+        raise typer.Abort()
+    request = {"command": command_name, "address": device_address, "kwargs": kwargs}
+    writer.write(json.dumps(request, default=datetime.isoformat).encode() + b"\n")
+    await writer.drain()
+    response = (await reader.readline()).decode().strip()
+    writer.close()
+    await writer.wait_closed()
+    if response != "ok":
+        print(response)
+        raise typer.Abort()
 
-    asyncio.run(_async_func())
+
+@app.command()
+def daemon(socket: Annotated[str, typer.Option()] = DEFAULT_DAEMON_SOCKET) -> None:
+    """Keep lights connected and run commands received on a unix socket.
+
+    Other commands are sent to the daemon with the --via option.
+    """
+    from .device import BaseDevice, get_device_from_address
+
+    devices: dict[str, BaseDevice] = {}
+    # one lock per address so that concurrent clients create a single device
+    device_locks: dict[str, asyncio.Lock] = {}
+
+    async def _run_request(line: bytes) -> str:
+        request = json.loads(line)
+        command_name: str = request["command"]
+        address: str = request["address"].upper()
+        async with device_locks.setdefault(address, asyncio.Lock()):
+            if address not in devices:
+                devices[address] = await get_device_from_address(address)
+        dev = devices[address]
+        if command_name.startswith("_") or not hasattr(dev, command_name):
+            return f"{dev.__class__.__name__} doesn't support {command_name}"
+        kwargs: dict[str, Any] = request["kwargs"]
+        for arg in _DATETIME_ARGS:
+            if arg in kwargs:
+                kwargs[arg] = datetime.fromisoformat(kwargs[arg])
+        # the connection is kept open and closed by the device disconnect timer
+        await getattr(dev, command_name)(**kwargs)
+        return "ok"
+
+    async def _handle_client(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        while line := await reader.readline():
+            try:
+                response = await _run_request(line)
+            except Exception as ex:
+                response = f"error: {ex!r}"
+            writer.write(response.encode() + b"\n")
+            await writer.drain()
+        writer.close()
+        await writer.wait_closed()
+
+    async def _serve() -> None:
+        server = await asyncio.start_unix_server(_handle_client, socket)
+        print(f"Listening on {socket}")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            for dev in devices.values():
+                await dev.disconnect()
+
+    _run(_serve())
 
 
 @app.command()
@@ -40,29 +145,54 @@ def list_devices(timeout: Annotated[int, typer.Option()] = 5) -> None:
 
     TODO: add an option to show only Chihiros devices
     """
-    table = Table("Name", "Address", "Model")
-    discovered_devices = asyncio.run(BleakScanner.discover(timeout=timeout))
-    for device in discovered_devices:
-        model_name = "???"
-        if device.name is not None:
-            model_class = get_model_class_from_name(device.name)
-            if model_class.model_code:  # type: ignore
-                model_name = model_class.model_name  # type: ignore
-        table.add_row(device.name, device.address, model_name)
+    from bleak import BleakScanner
+    from bleak.backends.device import BLEDevice
+    from bleak.backends.scanner import AdvertisementData
+    from rich.live import Live
+    from rich.table import Table
+
+    from .device import get_model_class_from_name
+
+    # address -> (name, model name), rows are shown as soon as they are found
+    devices: dict[str, tuple[str | None, str]] = {}
+
+    def _render_table() -> Table:
+        table = Table("Name", "Address", "Model")
+        for address, (name, model_name) in devices.items():
+            table.add_row(name, address, model_name)
+        return table
+
     print("Discovered the following devices:")
-    print(table)
+    with Live(_render_table(), refresh_per_second=4) as live:
+
+        def _on_detection(device: BLEDevice, _adv: AdvertisementData) -> None:
+            if device.address in devices and devices[device.address][0] == device.name:
+                return
+            model_name = "???"
+            if device.name is not None:
+                model_class = get_model_class_from_name(device.name)
+                if model_class.model_codes:  # type: ignore
+                    model_name = model_class.model_name  # type: ignore
+            devices[device.address] = (device.name, model_name)
+            live.update(_render_table())
+
+        async def _scan() -> None:
+            async with BleakScanner(detection_callback=_on_detection):
+                await asyncio.sleep(timeout)
+
+        _run(_scan())
 
 
 @app.command()
 def turn_on(device_address: str) -> None:
     """Turn on a light."""
-    _run_device_func(device_address)
+    _run_device_func("turn_on", device_address)
 
 
 @app.command()
 def turn_off(device_address: str) -> None:
     """Turn off a light."""
-    _run_device_func(device_address)
+    _run_device_func("turn_off", device_address)
 
 
 @app.command()
@@ -72,7 +202,9 @@ def set_color_brightness(
     brightness: Annotated[int, typer.Argument(min=0, max=100)],
 ) -> None:
     """Set color brightness of a light."""
-    _run_device_func(device_address, color=color, brightness=brightness)
+    _run_device_func(
+        "set_color_brightness", device_address, color=color, brightness=brightness
+    )
 
 
 @app.command()
@@ -80,7 +212,7 @@ def set_brightness(
     device_address: str, brightness: Annotated[int, typer.Argument(min=0, max=100)]
 ) -> None:
     """Set brightness of a light."""
-    set_color_brightness(device_address, color=0, brightness=brightness)
+    _run_device_func("set_brightness", device_address, brightness=brightness)
 
 
 @app.command()
@@ -88,7 +220,7 @@ def set_rgb_brightness(
     device_address: str, brightness: Annotated[tuple[int, int, int], typer.Argument()]
 ) -> None:
     """Set brightness of a RGB light."""
-    _run_device_func(device_address, brightness=brightness)
+    _run_device_func("set_rgb_brightness", device_address, brightness=brightness)
 
 
 @app.command()
@@ -102,6 +234,7 @@ def add_setting(
 ) -> None:
     """Add setting to a light."""
     _run_device_func(
+        "add_setting",
         device_address,
         sunrise=sunrise,
         sunset=sunset,
@@ -122,6 +255,7 @@ def add_rgb_setting(
 ) -> None:
     """Add setting to a RGB light."""
     _run_device_func(
+        "add_rgb_setting",
         device_address,
         sunrise=sunrise,
         sunset=sunset,
@@ -141,6 +275,7 @@ def remove_setting(
 ) -> None:
     """Remove setting from a light."""
     _run_device_func(
+        "remove_setting",
         device_address,
         sunrise=sunrise,
         sunset=sunset,
@@ -152,13 +287,13 @@ def remove_setting(
 @app.command()
 def reset_settings(device_address: str) -> None:
     """Reset settings from a light."""
-    _run_device_func(device_address)
+    _run_device_func("reset_settings", device_address)
 
 
 @app.command()
 def enable_auto_mode(device_address: str) -> None:
     """Enable auto mode in a light."""
-    _run_device_func(device_address)
+    _run_device_func("enable_auto_mode", device_address)
 
 
 if __name__ == "__main__":
@@ -1,68 +1,105 @@
 """Module defining commands generation functions."""
 
 import datetime
+from collections.abc import Sequence
+from functools import lru_cache, reduce
+from operator import xor
+
+# translation table replacing the reserved byte value 90 with 89
+_NO_90 = bytes(i if i != 90 else 89 for i in range(256))
 
 
 def next_message_id(current_msg_id: tuple[int, int] = (0, 0)) -> tuple[int, int]:
-    """Generate bluetooth message id."""
+    """Generate bluetooth message id.
+
+    Both bytes are counted up like a 16 bit counter, skipping the value 90.
+    """
     msg_id_higher_byte, msg_id_lower_byte = current_msg_id
-    if msg_id_lower_byte == 255:
-        if msg_id_higher_byte == 255:
+    msg_id_lower_byte += 1
+    if msg_id_lower_byte == 90:
+        # lower byte should never be 90
+        msg_id_lower_byte += 1
+    if msg_id_lower_byte > 255:
+        msg_id_lower_byte = 0
+        msg_id_higher_byte += 1
+        if msg_id_higher_byte == 90:
+            # higher byte should never be 90
+            msg_id_higher_byte += 1
+        if msg_id_higher_byte > 255:
             # start counting from the beginning
             return (0, 1)
-        if msg_id_higher_byte == 89:
-            # higher byte should never be 90
-            return (msg_id_higher_byte + 2, msg_id_lower_byte)
-        return (msg_id_higher_byte + 1, 0)
-
-    else:
-        if msg_id_lower_byte == 89:
-            # lower byte should never be 90
-            return (0, msg_id_lower_byte + 2)
-        return (0, msg_id_lower_byte + 1)
+    return (msg_id_higher_byte, msg_id_lower_byte)
 
 
 def _calculate_checksum(input_bytes: bytes) -> int:
     """Calculate message checksum."""
-    assert len(input_bytes) >= 7  # commands are always at least 7 bytes long
-    checksum = input_bytes[1]
-    for input_byte in input_bytes[2:]:
-        checksum = checksum ^ input_byte
-    return checksum
+    return reduce(xor, input_bytes[2:], input_bytes[1])
 
 
-def _create_command_encoding(
-    cmd_id: int, cmd_mode: int, msg_id: tuple[int, int], parameters: list[int]
-) -> bytearray:
-    """Encode command."""
+def _encode_command_body(
+    cmd_id: int, cmd_mode: int, parameters: Sequence[int]
+) -> bytes:
+    """Encode command with a zero message id."""
+    # header, parameters and a trailing placeholder for the verification byte
+    command = bytearray(len(parameters) + 7)
+    command[:6] = (cmd_id, 1, len(parameters) + 5, 0, 0, cmd_mode)
     # make sure that no parameter is 90
-    sanitized_params: list[int] = list(map(lambda x: x if x != 90 else 89, parameters))
+    command[6:-1] = bytes(parameters).translate(_NO_90)
+    command[-1] = _calculate_checksum(command)
+    return bytes(command)
+
+
+@lru_cache(maxsize=128)
+def _create_command_body(
+    cmd_id: int, cmd_mode: int, parameters: tuple[int, ...]
+) -> bytes:
+    """Encode command with a zero message id, cached for repeated commands."""
+    return _encode_command_body(cmd_id, cmd_mode, parameters)
+
+
+def _set_message_id(body: bytes, msg_id: tuple[int, int]) -> bytearray:
+    """Copy a command body encoded with a zero message id and set its message id."""
+    command = bytearray(body)
+    msg_id_higher_byte, msg_id_lower_byte = msg_id
+    command[3] = msg_id_higher_byte
+    command[4] = msg_id_lower_byte
+    # the body checksum was computed with both message id bytes set to 0
+    verification_byte = command[-1] ^ msg_id_higher_byte ^ msg_id_lower_byte
+    if verification_byte == 90:
+        # make sure that verification byte is not 90 by bumping the lower message
+        # id byte, changing a single byte always changes the checksum
+        msg_id_lower_byte = (command[4] + 1) & 0xFF
+        if msg_id_lower_byte == 90:
+            msg_id_lower_byte += 1
+        verification_byte ^= command[4] ^ msg_id_lower_byte
+        command[4] = msg_id_lower_byte
 
-    command = bytearray(
-        [cmd_id, 1, len(parameters) + 5, msg_id[0], msg_id[1], cmd_mode]
-        + sanitized_params
-    )
+    command[-1] = verification_byte
+    return command
 
-    verification_byte = _calculate_checksum(command)
-    if verification_byte == 90:
-        # make sure that verification byte is not 90
-        new_msg_id = (msg_id[0], msg_id[1] + 1)
-        return _create_command_encoding(cmd_id, cmd_mode, new_msg_id, sanitized_params)
 
-    return command + bytes([verification_byte])
+def _create_command_encoding(
+    cmd_id: int, cmd_mode: int, msg_id: tuple[int, int], parameters: Sequence[int]
+) -> bytearray:
+    """Encode command."""
+    # the same commands are sent over and over, only the message id differs
+    body = _create_command_body(cmd_id, cmd_mode, tuple(parameters))
+    return _set_message_id(body, msg_id)
 
 
-def _encode_timestamp(ts: datetime.datetime) -> list[int]:
+def _encode_timestamp(ts: datetime.datetime) -> bytes:
     """Encode timestamp."""
     # note: day is weekday e.g. 3 for wednesday
-    return [ts.year - 2000, ts.month, ts.isoweekday(), ts.hour, ts.minute, ts.second]
+    return bytes(
+        (ts.year - 2000, ts.month, ts.isoweekday(), ts.hour, ts.minute, ts.second)
+    )
 
 
 def create_set_time_command(msg_id: tuple[int, int]) -> bytearray:
     """Create current time command."""
-    return _create_command_encoding(
-        90, 9, msg_id, _encode_timestamp(datetime.datetime.now())
-    )
+    # timestamps never repeat, so keep them out of the command body cache
+    body = _encode_command_body(90, 9, _encode_timestamp(datetime.datetime.now()))
+    return _set_message_id(body, msg_id)
 
 
 def create_manual_setting_command(
@@ -73,7 +110,7 @@ def create_manual_setting_command(
     param: color: 0-2 (0 is red, 1 is green, 2 is blue; on non-RGB models, 0 is white)
     param: brightness_level: 0 - 100
     """
-    return _create_command_encoding(90, 7, msg_id, [color, brightness_level])
+    return _create_command_encoding(90, 7, msg_id, (color, brightness_level))
 
 
 def create_add_auto_setting_command(
@@ -91,7 +128,7 @@ def create_add_auto_setting_command(
     weekdays: int resulting of selection bit mask
               (Monday Tuesday Wednesday Thursday Friday Saturday Sunday) in decimal
     """
-    parameters = [
+    parameters = (
         sunrise.hour,
         sunrise.minute,
         sunset.hour,
@@ -104,7 +141,7 @@ def create_add_auto_setting_command(
         255,
         255,
         255,
-    ]
+    )
 
     return _create_command_encoding(165, 25, msg_id, parameters)
 
@@ -124,9 +161,9 @@ def create_delete_auto_setting_command(
 
 def create_reset_auto_settings_command(msg_id: tuple[int, int]) -> bytearray:
     """Create reset auto setting command."""
-    return _create_command_encoding(90, 5, msg_id, [5, 255, 255])
+    return _create_command_encoding(90, 5, msg_id, (5, 255, 255))
 
 
 def create_switch_to_auto_mode_command(msg_id: tuple[int, int]) -> bytearray:
     """Create switch auto setting command."""
-    return _create_command_encoding(90, 5, msg_id, [18, 255, 255])
+    return _create_command_encoding(90, 5, msg_id, (18, 255, 255))
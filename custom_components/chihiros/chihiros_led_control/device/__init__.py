@@ -1,7 +1,5 @@
 """Module defining Chihiros devices."""
 
-import inspect
-import sys
 from typing import Callable
 
 from bleak import BleakScanner
@@ -21,11 +19,22 @@ from .wrgb2 import WRGBII
 from .wrgb2_pro import WRGBIIPro
 from .wrgb2_slim import WRGBIISlim
 
-CODE2MODEL = {}
-for name, obj in inspect.getmembers(sys.modules[__name__]):
-    if inspect.isclass(obj) and issubclass(obj, BaseDevice):
-        for model_code in obj._model_codes:
-            CODE2MODEL[model_code] = obj
+CODE2MODEL: dict[str, type[BaseDevice]] = {
+    model_code: model_class
+    for model_class in (
+        TinyTerrariumEgg,
+        AII,
+        Commander1,
+        Commander4,
+        WRGBII,
+        WRGBIIPro,
+        WRGBIISlim,
+        CII,
+        CIIRGB,
+        UniversalWRGB,
+    )
+    for model_code in model_class._model_codes
+}
 
 
 def get_model_class_from_name(device_name: str) -> Callable[[BLEDevice], BaseDevice]:
@@ -56,9 +65,8 @@ __all__ = [
     "CII",
     "CIIRGB",
     "UniversalWRGB",
-    "FallBack",
+    "Fallback",
     "BaseDevice",
-    "RGBMode",
     "CODE2MODEL",
     "get_device_from_address",
     "get_model_class_from_name",
@@ -4,8 +4,8 @@ import asyncio
 import logging
 from abc import ABC, ABCMeta
 from datetime import datetime
+from types import TracebackType
 
-import typer
 from bleak.backends.device import BLEDevice
 from bleak.backends.scanner import AdvertisementData
 from bleak.backends.service import BleakGATTCharacteristic  # type: ignore
@@ -19,7 +19,7 @@ from bleak_retry_connector import (
     establish_connection,
     retry_bluetooth_connection_error,
 )
-from typing_extensions import Annotated
+from typing_extensions import Self
 
 from .. import commands
 from ..const import UART_RX_CHAR_UUID, UART_TX_CHAR_UUID
@@ -56,6 +56,7 @@ class BaseDevice(ABC):
         self._advertisement_data = advertisement_data
         self._client: BleakClientWithServiceCache | None = None
         self._disconnect_timer: asyncio.TimerHandle | None = None
+        self._disconnect_task: asyncio.Task[None] | None = None
         self._operation_lock: asyncio.Lock = asyncio.Lock()
         self._read_char: BleakGATTCharacteristic | None = None
         self._write_char: BleakGATTCharacteristic | None = None
@@ -64,6 +65,20 @@ class BaseDevice(ABC):
         self.loop = asyncio.get_running_loop()
         assert self._model_name is not None
 
+    async def __aenter__(self) -> Self:
+        """Connect to the device, sharing the connection for all commands."""
+        await self._ensure_connected()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Disconnect from the device."""
+        await self.disconnect()
+
     # Base methods
 
     def set_log_level(self, level: int | str) -> None:
@@ -128,7 +143,7 @@ class BaseDevice(ABC):
 
     async def set_color_brightness(
         self,
-        brightness: Annotated[int, typer.Argument(min=0, max=100)],
+        brightness: int,
         color: str | int = 0,
     ) -> None:
         """Set brightness of a color."""
@@ -145,38 +160,53 @@ class BaseDevice(ABC):
         )
         await self._send_command(cmd, 3)
 
-    async def set_brightness(
-        self, brightness: Annotated[int, typer.Argument(min=0, max=100)]
-    ) -> None:
+    async def set_brightness(self, brightness: int) -> None:
         """Set light brightness."""
         await self.set_color_brightness(brightness)
 
-    async def set_rgb_brightness(
-        self, brightness: Annotated[tuple[int, int, int], typer.Argument()]
-    ) -> None:
+    async def set_rgb_brightness(self, brightness: tuple[int, int, int]) -> None:
         """Set RGB brightness."""
-        for c, b in enumerate(brightness):
-            await self.set_color_brightness(c, b)
+        color_ids = self._colors.values()
+        cmds = []
+        for color_id, color_brightness in enumerate(brightness):
+            if color_id not in color_ids:
+                self._logger.warning("Color not supported: `%s`", color_id)
+                continue
+            cmds.append(
+                commands.create_manual_setting_command(
+                    self.get_next_msg_id(), color_id, color_brightness
+                )
+            )
+        if cmds:
+            # send all colors in one batch so the writes are pipelined
+            await self._send_command(cmds, 3)
 
     async def turn_on(self) -> None:
         """Turn on light."""
-        for color_name in self._colors:
-            await self.set_color_brightness(100, color_name)
+        await self._set_all_colors_brightness(100)
 
     async def turn_off(self) -> None:
         """Turn off light."""
-        for color_name in self._colors:
-            await self.set_color_brightness(0, color_name)
+        await self._set_all_colors_brightness(0)
+
+    async def _set_all_colors_brightness(self, brightness: int) -> None:
+        """Set the same brightness on every color in one batch."""
+        # several color names can share the same color id
+        cmds = [
+            commands.create_manual_setting_command(
+                self.get_next_msg_id(), color_id, brightness
+            )
+            for color_id in dict.fromkeys(self._colors.values())
+        ]
+        await self._send_command(cmds, 3)
 
     async def add_setting(
         self,
-        sunrise: Annotated[datetime, typer.Argument(formats=["%H:%M"])],
-        sunset: Annotated[datetime, typer.Argument(formats=["%H:%M"])],
-        max_brightness: Annotated[int, typer.Option(max=100, min=0)] = 100,
-        ramp_up_in_minutes: Annotated[int, typer.Option(min=0, max=150)] = 0,
-        weekdays: Annotated[list[WeekdaySelect], typer.Option()] = [
-            WeekdaySelect.everyday
-        ],
+        sunrise: datetime,
+        sunset: datetime,
+        max_brightness: int = 100,
+        ramp_up_in_minutes: int = 0,
+        weekdays: list[WeekdaySelect] = [WeekdaySelect.everyday],
     ) -> None:
         """Add an automation setting to the light."""
         cmd = commands.create_add_auto_setting_command(
@@ -191,17 +221,11 @@ class BaseDevice(ABC):
 
     async def add_rgb_setting(
         self,
-        sunrise: Annotated[datetime, typer.Argument(formats=["%H:%M"])],
-        sunset: Annotated[datetime, typer.Argument(formats=["%H:%M"])],
-        max_brightness: Annotated[tuple[int, int, int], typer.Option()] = (
-            100,
-            100,
-            100,
-        ),
-        ramp_up_in_minutes: Annotated[int, typer.Option(min=0, max=150)] = 0,
-        weekdays: Annotated[list[WeekdaySelect], typer.Option()] = [
-            WeekdaySelect.everyday
-        ],
+        sunrise: datetime,
+        sunset: datetime,
+        max_brightness: tuple[int, int, int] = (100, 100, 100),
+        ramp_up_in_minutes: int = 0,
+        weekdays: list[WeekdaySelect] = [WeekdaySelect.everyday],
     ) -> None:
         """Add an automation setting to the RGB light."""
         cmd = commands.create_add_auto_setting_command(
@@ -216,12 +240,10 @@ class BaseDevice(ABC):
 
     async def remove_setting(
         self,
-        sunrise: Annotated[datetime, typer.Argument(formats=["%H:%M"])],
-        sunset: Annotated[datetime, typer.Argument(formats=["%H:%M"])],
-        ramp_up_in_minutes: Annotated[int, typer.Option(min=0, max=150)] = 0,
-        weekdays: Annotated[list[WeekdaySelect], typer.Option()] = [
-            WeekdaySelect.everyday
-        ],
+        sunrise: datetime,
+        sunset: datetime,
+        ramp_up_in_minutes: int = 0,
+        weekdays: list[WeekdaySelect] = [WeekdaySelect.everyday],
     ) -> None:
         """Remove an automation setting from the light."""
         cmd = commands.create_delete_auto_setting_command(
@@ -242,8 +264,7 @@ class BaseDevice(ABC):
         """Enable auto mode of the light."""
         switch_cmd = commands.create_switch_to_auto_mode_command(self.get_next_msg_id())
         time_cmd = commands.create_set_time_command(self.get_next_msg_id())
-        await self._send_command(switch_cmd, 3)
-        await self._send_command(time_cmd, 3)
+        await self._send_command([switch_cmd, time_cmd], 3)
 
     # Bluetooth methods
 
@@ -331,14 +352,16 @@ class BaseDevice(ABC):
             raise CharacteristicMissingError("Read characteristic missing")
         if not self._write_char:
             raise CharacteristicMissingError("Write characteristic missing")
+        # write without response lets the stack queue all commands back-to-back
+        response = "write-without-response" not in self._write_char.properties
         for command in commands:
-            await self._client.write_gatt_char(self._write_char, command, False)
+            await self._client.write_gatt_char(self._write_char, command, response)
 
     def _notification_handler(
         self, _sender: BleakGATTCharacteristic, data: bytearray
     ) -> None:
         """Handle notification responses."""
-        self._logger.warning("%s: Notification received: %s", self.name, data)
+        self._logger.debug("%s: Notification received: %s", self.name, data)
 
     def _disconnected(self, client: BleakClientWithServiceCache) -> None:
         """Disconnected callback."""
@@ -354,15 +377,12 @@ class BaseDevice(ABC):
         )
 
     def _resolve_characteristics(self, services: BleakGATTServiceCollection) -> bool:
-        """Resolve characteristics."""
-        for characteristic in [UART_TX_CHAR_UUID]:
-            if char := services.get_characteristic(characteristic):
-                self._read_char = char
-                break
-        for characteristic in [UART_RX_CHAR_UUID]:
-            if char := services.get_characteristic(characteristic):
-                self._write_char = char
-                break
+        """Resolve characteristics.
+
+        They are kept for the whole connection, so writes never look up UUIDs.
+        """
+        self._read_char = services.get_characteristic(UART_TX_CHAR_UUID)
+        self._write_char = services.get_characteristic(UART_RX_CHAR_UUID)
         return bool(self._read_char and self._write_char)
 
     async def _ensure_connected(self) -> None:
@@ -416,6 +436,9 @@ class BaseDevice(ABC):
     async def disconnect(self) -> None:
         """Disconnect."""
         self._logger.debug("%s: Disconnecting", self.name)
+        if self._disconnect_timer:
+            self._disconnect_timer.cancel()
+            self._disconnect_timer = None
         await self._execute_disconnect()
 
     async def _execute_disconnect(self) -> None:
@@ -440,7 +463,10 @@ class BaseDevice(ABC):
     def _disconnect(self) -> None:
         """Disconnect from device."""
         self._disconnect_timer = None
-        asyncio.create_task(self._execute_timed_disconnect())
+        # keep a reference so the task is not garbage collected while running
+        self._disconnect_task = self.loop.create_task(
+            self._execute_timed_disconnect()
+        )
 
     async def _execute_timed_disconnect(self) -> None:
         """Execute timed disconnection."""
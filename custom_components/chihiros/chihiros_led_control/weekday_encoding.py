@@ -16,23 +16,22 @@ class WeekdaySelect(str, Enum):
     everyday = "everyday"
 
 
+# bit of each weekday in the encoding, from monday as the highest bit
+_WEEKDAY_BITS: dict[WeekdaySelect, int] = {
+    WeekdaySelect.monday: 64,
+    WeekdaySelect.tuesday: 32,
+    WeekdaySelect.wednesday: 16,
+    WeekdaySelect.thursday: 8,
+    WeekdaySelect.friday: 4,
+    WeekdaySelect.saturday: 2,
+    WeekdaySelect.sunday: 1,
+    WeekdaySelect.everyday: 127,
+}
+
+
 def encode_selected_weekdays(selection: list[WeekdaySelect]) -> int:
     """Encode list of weekdays."""
     encoding = 0
-    if WeekdaySelect.everyday in selection:
-        return 127
-    if WeekdaySelect.monday in selection:
-        encoding += 64
-    if WeekdaySelect.tuesday in selection:
-        encoding += 32
-    if WeekdaySelect.wednesday in selection:
-        encoding += 16
-    if WeekdaySelect.thursday in selection:
-        encoding += 8
-    if WeekdaySelect.friday in selection:
-        encoding += 4
-    if WeekdaySelect.saturday in selection:
-        encoding += 2
-    if WeekdaySelect.sunday in selection:
-        encoding += 1
+    for weekday in selection:
+        encoding |= _WEEKDAY_BITS[weekday]
     return encoding
@@ -65,7 +65,7 @@ class ChihirosDataUpdateCoordinator(CoordinatorParent):  # type: ignore
         change: bluetooth.BluetoothChange,
     ) -> None:
         """Handle a Bluetooth event."""
-        _LOGGER.critical("%s: CHIHIROS data: %s", self.ble_device.address, self.data)
+        _LOGGER.debug("%s: CHIHIROS data: %s", self.ble_device.address, self.data)
         super()._async_handle_bluetooth_event(service_info, change)
 
     @callback
@@ -73,6 +73,6 @@ class ChihirosDataUpdateCoordinator(CoordinatorParent):  # type: ignore
         self, service_info: bluetooth.BluetoothServiceInfoBleak
     ) -> None:
         """Handle the device going unavailable."""
-        _LOGGER.critical("%s: CHIHIROS device unavailable: %s", self.ble_device.address)
+        _LOGGER.debug("%s: CHIHIROS device unavailable", self.ble_device.address)
         super()._async_handle_unavailable(service_info)
         # self._was_unavailable = True
@@ -32,21 +32,30 @@ async def async_setup_entry(
 ) -> None:
     """Set up the light platform for LEDBLE."""
     chihiros_data: ChihirosData = hass.data[DOMAIN][entry.entry_id]
-    _LOGGER.debug("Setup chihiros entry: %s", chihiros_data.device.address)
-    for color in chihiros_data.device.colors:
-        _LOGGER.debug(
-            "Setup chihiros light entity: %s - %s", chihiros_data.device.address, color
-        )
-        async_add_entities(
-            [
-                ChihirosLightEntity(
-                    chihiros_data.coordinator,
-                    chihiros_data.device,
-                    entry,
-                    color=color,
-                )
-            ]
-        )
+    device = chihiros_data.device
+    _LOGGER.debug("Setup chihiros entry: %s", device.address)
+    # all the entities of a device share the same device info
+    device_info = DeviceInfo(
+        connections={(dr.CONNECTION_BLUETOOTH, chihiros_data.coordinator.address)},
+        manufacturer=MANUFACTURER,
+        model=device.model_name,
+        name=device.name,
+    )
+    _LOGGER.debug(
+        "Setup chihiros light entities: %s - %s", device.address, device.colors
+    )
+    async_add_entities(
+        [
+            ChihirosLightEntity(
+                chihiros_data.coordinator,
+                device,
+                entry,
+                color=color,
+                device_info=device_info,
+            )
+            for color in device.colors
+        ]
+    )
 
 
 class ChihirosLightEntity(
@@ -67,6 +76,7 @@ class ChihirosLightEntity(
         chihiros_device: BaseDevice,
         config_entry: ConfigEntry,
         color: str,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialise the entity."""
         super().__init__(coordinator)
@@ -79,13 +89,7 @@ class ChihirosLightEntity(
         self._attr_color = self._color
         self._attr_extra_state_attributes = {"color": self._color}
 
-        model_name: str = self._device.model_name
-        self._attr_device_info = DeviceInfo(
-            connections={(dr.CONNECTION_BLUETOOTH, self._address)},
-            manufacturer=MANUFACTURER,
-            model=model_name,
-            name=self._device.name,
-        )
+        self._attr_device_info = device_info
 
     async def async_added_to_hass(self) -> None:
         """Handle entity about to be added to hass event."""
@@ -118,7 +122,7 @@ class ChihirosLightEntity(
             await self._device.set_color_brightness(100, self._color)
         self._attr_is_on = True
         self._attr_available = True
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
         _LOGGER.debug("Turned on: %s", self.name)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
@@ -129,5 +133,5 @@ class ChihirosLightEntity(
         self._attr_is_on = False
         self._attr_brightness = 0
         self._attr_available = True
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
         _LOGGER.debug("Turned off: %s", self.name)